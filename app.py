@@ -7,13 +7,29 @@
 # ============================================================
 
 import warnings
-warnings.filterwarnings("ignore")
+# Solo se silencia el aviso de urllib3 por verify=False en la API del BCRA.
+warnings.filterwarnings("ignore", message="Unverified HTTPS request")
+
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from io import BytesIO
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
-import requests
 import streamlit as st
-import plotly.graph_objects as go
+from pandas.tseries.api import guess_datetime_format
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Solo se detecta el motor; el import real lo hace pandas al leer el Excel.
+EXCEL_ENGINE = "calamine" if find_spec("python_calamine") else None
 
 
 # ----------------------------
@@ -23,6 +39,76 @@ st.set_page_config(page_title="Macroeconomía", layout="wide")
 st.title("Macroeconomía")
 
 
+# ----------------------------
+# HOME: estilos y encabezado (constante de módulo)
+# ----------------------------
+HOME_HTML = """
+    <style>
+      /* Oculta SOLO el título/caption global en Home (sin matar textos internos) */
+      div[data-testid="stAppViewContainer"] h1 { display:none; }
+      div[data-testid="stAppViewContainer"] .stCaption { display:none; }
+
+      /* Fondo gris claro */
+      [data-testid="stAppViewContainer"] { background: #f2f4f7; }
+
+      /* Contenedor centrado */
+      .home-wrap{
+        max-width: 980px;
+        margin: 0 auto;
+        padding-top: 10px;
+        text-align: center;
+      }
+
+      .home-title{
+        font-size: 44px;
+        font-weight: 800;
+        color: #0b2b4c;
+        margin-bottom: 10px;
+      }
+
+      .home-subtitle{
+        font-size: 18px;
+        color: #243447;
+        margin-bottom: 28px;
+      }
+
+      /* Cards SOLO para botones dentro de .home-cards */
+      .home-cards div.stButton > button{
+        width: 100% !important;
+        background: #dbeafe !important;
+        border: 1px solid rgba(11,43,76,0.18) !important;
+        border-radius: 18px !important;
+        padding: 18px 18px !important;
+        height: 90px !important;
+        box-shadow: 0 8px 22px rgba(0,0,0,0.06) !important;
+        transition: all 0.15s ease-in-out !important;
+      }
+
+      .home-cards div.stButton > button:hover{
+        transform: translateY(-2px);
+        box-shadow: 0 12px 28px rgba(0,0,0,0.10) !important;
+        border-color: rgba(11,43,76,0.30) !important;
+      }
+
+      /* Texto (emoji + nombre) */
+      .home-cards div.stButton > button{
+        color: #0b2b4c !important;
+        font-weight: 800 !important;
+        font-size: 20px !important;
+      }
+
+      @media (max-width: 900px){
+        .home-title{ font-size: 36px; }
+      }
+    </style>
+
+    <div class="home-wrap">
+      <div class="home-title">Macroeconomía</div>
+      <div class="home-subtitle">Seleccioná una variable</div>
+    </div>
+    """
+
+
 # ----------------------------
 # Navegación
 # ----------------------------
@@ -34,72 +120,232 @@ if "section" in params:
     st.session_state.section = params["section"]
 
 
+# ============================================================
+# Sesión HTTP compartida (keep-alive + reintentos con backoff)
+# ============================================================
+# Recurso del proceso: sobrevive a los reruns del script (las conexiones
+# quedan abiertas) y difiere el import de requests hasta la primera descarga.
+@st.cache_resource
+def get_session():
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        ),
+    )
+    return session
+
+
+def fetch_concurrently(*loaders):
+    # Las descargas son independientes: se solapan sus latencias de red.
+    # Cada hilo hereda el contexto de Streamlit para que st.warning/caché funcionen.
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=len(loaders), initializer=add_script_run_ctx, initargs=(None, ctx)
+    ) as ex:
+        futures = [ex.submit(fn) for fn in loaders]
+        return [f.result() for f in futures]
+
+
+def iter_monetaria_pages(url, limit=1000):
+    # La primera página trae el total de registros; el resto de los offsets se
+    # piden en paralelo sobre la misma sesión y se entregan en orden.
+    session = get_session()
+
+    # verify=False queda acotado a la API de estadísticas del BCRA: la cadena de
+    # certificados de api.bcra.gob.ar no se puede verificar con el bundle de
+    # certifi. INDEC y el REM se descargan con la verificación TLS por defecto.
+    def fetch(offset):
+        r = session.get(
+            url, params={"Limit": limit, "Offset": offset}, timeout=(3, 10), verify=False
+        )
+        r.raise_for_status()
+        payload = json_loads(r.content)
+        if not isinstance(payload, dict):
+            raise ValueError("respuesta inesperada de la API")
+        return payload
+
+    payload = fetch(0)
+    results = payload.get("results", [])
+    if not results:
+        return
+    yield results[0].get("detalle", [])
+
+    offsets = range(limit, payload["metadata"]["resultset"]["count"], limit)
+    if not offsets:
+        return
+    with ThreadPoolExecutor(max_workers=min(len(offsets), 8)) as ex:
+        for payload in ex.map(fetch, offsets):
+            results = payload.get("results", [])
+            # Una página intermedia vacía dejaría la serie con un hueco.
+            if not results:
+                raise ValueError("página vacía de la API")
+            yield results[0].get("detalle", [])
+
+
+# ============================================================
+# Caché en disco (parquet) por ventana de TTL
+# ============================================================
+CACHE_DIR = Path(__file__).parent / ".cache"
+
+
+def disk_cache(name, ttl):
+    # Respalda el resultado de una descarga en un parquet por ventana de TTL:
+    # un proceso nuevo (reinicio del contenedor) lo lee sin tocar la red.
+    # Contrato: el loader lanza una excepción si la descarga quedó incompleta,
+    # así solo se persisten cargas completas (la excepción no escribe nada).
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args):
+            stem = "-".join([name, *map(str, args)])
+            path = CACHE_DIR / f"{stem}-{int(time.time() // ttl)}.parquet"
+            if path.exists():
+                return pd.read_parquet(path)
+
+            df = fn(*args)
+            if df.empty:
+                return df
+
+            try:
+                CACHE_DIR.mkdir(exist_ok=True)
+                for old in CACHE_DIR.glob(f"{stem}-*.parquet"):
+                    old.unlink(missing_ok=True)
+                tmp = path.with_suffix(".tmp")
+                df.to_parquet(tmp, compression="zstd")
+                tmp.replace(path)
+            except OSError:
+                pass
+            return df
+
+        return wrapper
+
+    return deco
+
+
 # ============================================================
 # A3500 – API BCRA (idVariable = 84)
 # ============================================================
-@st.cache_data(ttl=60 * 60)
-def get_a3500() -> pd.DataFrame:
+@disk_cache("a3500", ttl=60 * 60)
+def load_a3500() -> pd.DataFrame:
+    # Lanza ante cualquier falla (de red, de formato o de una página intermedia)
+    # para que nunca quede persistida una serie truncada.
     url = "https://api.bcra.gob.ar/estadisticas/v4.0/Monetarias/84"
-    params = {"Limit": 1000, "Offset": 0}
-    data = []
-
-    for _ in range(3):
-        try:
-            while True:
-                r = requests.get(url, params=params, timeout=10, verify=False)
-                r.raise_for_status()
-                payload = r.json()
-
-                results = payload.get("results", [])
-                if not results:
-                    break
-
-                detalle = results[0].get("detalle", [])
-                if not detalle:
-                    break
-
-                data.extend(detalle)
-
-                meta = payload["metadata"]["resultset"]
-                params["Offset"] += params["Limit"]
-                if params["Offset"] >= meta["count"]:
-                    break
-            break
-        except requests.exceptions.RequestException:
-            pass
-
-    if not data:
-        st.warning("⚠️ No se pudo conectar con la API del BCRA (A3500).")
-        return pd.DataFrame(columns=["Date", "FX"])
+    fechas, valores = [], []
+    for detalle in iter_monetaria_pages(url):
+        fechas.extend(d["fecha"] for d in detalle)
+        valores.extend(d["valor"] for d in detalle)
 
-    df = pd.DataFrame(data)
-    df["Date"] = pd.to_datetime(df["fecha"], errors="coerce")
-    df["FX"] = pd.to_numeric(df["valor"], errors="coerce")
+    if not fechas:
+        raise ValueError("la API no devolvió registros")
+
+    df = pd.DataFrame(
+        {
+            "Date": pd.to_datetime(
+                fechas, format="%Y-%m-%d", errors="coerce", cache=True
+            ).as_unit("s"),
+            "FX": pd.to_numeric(valores, errors="coerce", downcast="float"),
+        }
+    )
 
     return (
-        df[["Date", "FX"]]
-        .dropna()
+        df.dropna()
         .drop_duplicates(subset=["Date"])
         .sort_values("Date")
         .reset_index(drop=True)
     )
 
 
+@st.cache_data(ttl=60 * 60)
+def get_a3500() -> pd.DataFrame:
+    from requests.exceptions import RequestException
+
+    try:
+        return load_a3500()
+    except (RequestException, ValueError, KeyError):
+        # ValueError/KeyError: cuerpo que no es JSON o sin la forma esperada;
+        # se trata igual que una falla de conexión (se muestran solo las bandas).
+        st.warning("⚠️ No se pudo conectar con la API del BCRA (A3500).")
+        return pd.DataFrame(columns=["Date", "FX"])
+
+
 # ============================================================
 # REM – última publicación
 # ============================================================
+def parse_dates(s: pd.Series) -> pd.Series:
+    # Infiere el formato una sola vez (sobre el primer valor) para evitar el
+    # parseo fila a fila con dateutil cuando el Excel trae fechas como texto.
+    # Si la columna ya es datetime (lo habitual), no hay nada que convertir.
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s
+    muestra = s.dropna()
+    fmt = guess_datetime_format(str(muestra.iloc[0])) if len(muestra) else None
+    return pd.to_datetime(s, format=fmt, errors="coerce", cache=True)
+
+
+REM_COLS = ["Variable", "Referencia", "Fecha de pronóstico", "Período", "Mediana"]
+REM_VARIABLE = "Precios minoristas (IPC nivel general; INDEC)"
+REM_REFERENCIA = "var. % mensual"
+
+
 @st.cache_data(ttl=60 * 60)
+@disk_cache("rem_dec", ttl=60 * 60)
 def get_rem_last():
     url = (
         "https://www.bcra.gob.ar/archivos/Pdfs/PublicacionesEstadisticas/"
         "historico-relevamiento-expectativas-mercado.xlsx"
     )
-    df = pd.read_excel(url, sheet_name="Base de Datos Completa", skiprows=1)
+    r = get_session().get(url, timeout=(3, 30))
+    r.raise_for_status()
+    return parse_rem_xlsx(r.content)
+
+
+def read_rem_ipc_rows(raw: bytes) -> pd.DataFrame:
+    if EXCEL_ENGINE == "calamine":
+        df = pd.read_excel(
+            BytesIO(raw),
+            sheet_name="Base de Datos Completa",
+            skiprows=1,
+            usecols=REM_COLS,
+            engine=EXCEL_ENGINE,
+        )
+        df["Variable"] = df["Variable"].astype("category")
+        df["Referencia"] = df["Referencia"].astype("category")
+        return df.loc[(df["Variable"] == REM_VARIABLE) & (df["Referencia"] == REM_REFERENCIA)]
 
-    rem = df.loc[
-        (df["Variable"] == "Precios minoristas (IPC nivel general; INDEC)")
-        & (df["Referencia"] == "var. % mensual")
-    ].copy()
+    # Sin calamine: una pasada en streaming (openpyxl read-only) que descarta
+    # las filas que no interesan antes de armar el DataFrame.
+    import openpyxl
+
+    wb = openpyxl.load_workbook(BytesIO(raw), read_only=True, data_only=True)
+    try:
+        rows = wb["Base de Datos Completa"].iter_rows(min_row=2, values_only=True)
+        header = next(rows)
+        pos = [header.index(c) for c in REM_COLS]
+        i_var, i_ref = pos[0], pos[1]
+        data = [
+            [row[i] for i in pos]
+            for row in rows
+            if row[i_var] == REM_VARIABLE and row[i_ref] == REM_REFERENCIA
+        ]
+    finally:
+        wb.close()
+
+    return pd.DataFrame(data, columns=REM_COLS)
+
+
+# El parseo se cachea por contenido: si el archivo no cambió al vencer el TTL
+# de la descarga, no se vuelve a leer el Excel. Al depender solo de los bytes,
+# puede persistirse en disco y sobrevivir reinicios del contenedor.
+@st.cache_data(max_entries=1, persist="disk")
+def parse_rem_xlsx(raw: bytes) -> pd.DataFrame:
+    rem = read_rem_ipc_rows(raw)
 
     latest = rem["Fecha de pronóstico"].max()
 
@@ -108,7 +354,10 @@ def get_rem_last():
         .sort_values("Período")
         .tail(24)
         .rename(columns={"Período": "Date", "Mediana": "v_m_REM"})
-        .assign(Date=lambda x: pd.to_datetime(x["Date"], errors="coerce"))
+        .assign(
+            Date=lambda x: parse_dates(x["Date"]),
+            v_m_REM=lambda x: pd.to_numeric(x["v_m_REM"], errors="coerce") / 100.0,
+        )
         .reset_index(drop=True)
     )
 
@@ -117,21 +366,42 @@ def get_rem_last():
 # IPC – INDEC FTP (completo)
 # ============================================================
 @st.cache_data(ttl=12 * 60 * 60)
+@disk_cache("ipc", ttl=12 * 60 * 60)
 def get_ipc_indec_full() -> pd.DataFrame:
     url = "https://www.indec.gob.ar/ftp/cuadros/economia/serie_ipc_divisiones.csv"
+    r = get_session().get(url, timeout=(3, 30))
+    r.raise_for_status()
+    raw = r.content
+
+    # El lector de pyarrow no falla ante UTF-8 inválido: el encoding se decide antes.
     try:
-        df = pd.read_csv(url, sep=";", decimal=",", encoding="utf-8")
+        raw.decode("utf-8")
+        encoding = "utf-8"
     except UnicodeDecodeError:
-        df = pd.read_csv(url, sep=";", decimal=",", encoding="latin1")
+        encoding = "latin1"
+
+    # Parser multihilo de pyarrow; las columnas de texto tienen pocas
+    # categorías y se leen directo como category.
+    df = pd.read_csv(
+        BytesIO(raw),
+        sep=";",
+        decimal=",",
+        encoding=encoding,
+        engine="pyarrow",
+        dtype={"Descripcion": "category", "Clasificador": "category", "Region": "category"},
+    )
 
     df["Codigo"] = pd.to_numeric(df["Codigo"], errors="coerce")
-    df["Periodo"] = pd.to_datetime(df["Periodo"].astype(str), format="%Y%m", errors="coerce")
+    df["Periodo"] = pd.to_datetime(
+        df["Periodo"].astype(str), format="%Y%m", errors="coerce", cache=True
+    ).dt.as_unit("s")
 
+    # strip sobre las categorías (no sobre cada fila)
     for c in ["Descripcion", "Clasificador", "Region"]:
-        df[c] = df[c].astype(str).str.strip()
+        df[c] = df[c].map(str.strip, na_action="ignore").astype("category")
 
     for c in ["Indice_IPC", "v_m_IPC", "v_i_a_IPC"]:
-        df[c] = pd.to_numeric(df[c], errors="coerce")
+        df[c] = pd.to_numeric(df[c], errors="coerce", downcast="float")
 
     return (
         df.dropna(subset=["Periodo"])
@@ -141,11 +411,33 @@ def get_ipc_indec_full() -> pd.DataFrame:
 
 
 @st.cache_data(ttl=12 * 60 * 60)
-def get_ipc_nacional_nivel_general() -> pd.DataFrame:
+def get_ipc_by_region() -> dict:
     df = get_ipc_indec_full()
+    return {
+        region: g.reset_index(drop=True)
+        for region, g in df.groupby("Region", sort=False, observed=True)
+    }
+
+
+# Recurso compartido (sin copia por rerun): la serie de cada división sale de
+# posiciones precalculadas, sin recorrer la tabla con máscaras booleanas.
+# Las opciones del selector y la posición por defecto salen del mismo índice,
+# en la misma entrada de caché, para que nunca queden desfasadas.
+@st.cache_resource(ttl=12 * 60 * 60)
+def get_ipc_index(region: str):
+    df = get_ipc_by_region()[region]
+    posiciones = df.groupby("Descripcion", sort=False, observed=True).indices
+    opciones = tuple(sorted(posiciones))
+    default = opciones.index("Nivel general") if "Nivel general" in opciones else 0
+    return df, posiciones, opciones, default
+
+
+@st.cache_data(ttl=12 * 60 * 60)
+def get_ipc_nacional_nivel_general() -> pd.DataFrame:
+    df = get_ipc_by_region()["Nacional"]
 
     tmp = (
-        df[(df["Codigo"] == 0) & (df["Region"] == "Nacional")]
+        df.loc[df["Codigo"].eq(0)]
         .dropna(subset=["v_m_IPC"])
         .rename(columns={"Periodo": "Date"})
         .sort_values("Date")
@@ -164,67 +456,104 @@ def get_ipc_nacional_nivel_general() -> pd.DataFrame:
 # ============================================================
 # Bandas 2025 / 2026
 # ============================================================
+# Las bandas son funciones puras de sus argumentos: se persisten en disco.
+# (persist="disk" ignora el TTL, por eso no se usa en las descargas.)
+@st.cache_data(persist="disk")
 def build_bands_2025(start, end, lower0, upper0):
-    g_up = (1 + 0.01) ** (1 / 30)
-    g_dn = (1 - 0.01) ** (1 / 30)
-
-    dates = pd.date_range(start, end, freq="D")
-    t = np.arange(len(dates))
+    # Nodos mensuales (más los extremos): la tasa diaria es constante, así que
+    # cualquier día intermedio se recupera interpolando en escala log.
+    dates = pd.date_range(start, end, freq="MS", unit="s").union(
+        pd.to_datetime([start, end]).as_unit("s")
+    )
+    t = (dates - dates[0]).days.to_numpy()
 
+    # ±1% mensual repartido en 30 días, en escala log: un solo exp por columna.
     return pd.DataFrame(
         {
             "Date": dates,
-            "lower": lower0 * (g_dn**t),
-            "upper": upper0 * (g_up**t),
+            "lower": (lower0 * np.exp(np.log1p(-0.01) / 30 * t)).astype(np.float32),
+            "upper": (upper0 * np.exp(np.log1p(0.01) / 30 * t)).astype(np.float32),
         }
     )
 
 
+@st.cache_data(max_entries=4, persist="disk")
 def build_bands_2026(bands_2025, rem, ipc):
     rem_m = rem.assign(Period=rem["Date"].dt.to_period("M"))[["Period", "v_m_REM"]]
     m = ipc.merge(rem_m, on="Period", how="outer").sort_values("Period")
 
-    m["v_m_dec"] = np.where(m["v_m_CPI"].notna(), m["v_m_CPI"], m["v_m_REM"] / 100)
+    m["v_m_dec"] = m["v_m_CPI"].fillna(m["v_m_REM"])
 
     end_month = m.loc[m["v_m_REM"].notna(), "Period"].max() + 2
     b = pd.DataFrame({"Period": pd.period_range("2026-01", end_month, freq="M")})
     b["ref"] = b["Period"] - 2
-    b = b.merge(
-        m[["Period", "v_m_dec"]].rename(columns={"Period": "ref"}), on="ref", how="left"
+    b["v_m_dec"] = b["ref"].map(m.set_index("Period")["v_m_dec"])
+
+    seed = bands_2025["Date"].searchsorted(pd.Timestamp("2025-12-31"))
+    lower0 = bands_2025["lower"].iat[seed]
+    upper0 = bands_2025["upper"].iat[seed]
+
+    # Compounding mensual en forma cerrada: la tasa diaria es constante dentro
+    # de cada mes, así que alcanza con el nivel a fin de cada mes (nodos).
+    # Los días intermedios se reconstruyen en combine_bands_fx.
+    # En escala log el producto acumulado es un cumsum: log(1 + r_d) = log1p(v)/30
+    # y log(1 - r_d) = log1p(-expm1(log1p(v)/30)).
+    log_up = np.log1p(b["v_m_dec"]) / 30
+    log_dn = np.log1p(-np.expm1(log_up))
+    days = b["Period"].dt.days_in_month
+    b["Date"] = b["Period"].dt.end_time.dt.normalize().dt.as_unit("s")
+    b["lower"] = (lower0 * np.exp((log_dn * days).cumsum())).astype(np.float32)
+    b["upper"] = (upper0 * np.exp((log_up * days).cumsum())).astype(np.float32)
+
+    return b[["Date", "lower", "upper"]]
+
+
+def combine_bands_fx(bands, fx):
+    # Entre nodos consecutivos la banda crece a tasa diaria constante: interpolar
+    # log-linealmente en el tiempo da el valor exacto de cada día con cotización.
+    # fx ya viene ordenado por fecha: el recorte al rango de las bandas es un
+    # slice por búsqueda binaria, sin máscara booleana.
+    lo = fx["Date"].searchsorted(bands["Date"].iat[0], side="left")
+    hi = fx["Date"].searchsorted(bands["Date"].iat[-1], side="right")
+    fx = fx.iloc[lo:hi]
+    dates = pd.DatetimeIndex(bands["Date"]).union(pd.DatetimeIndex(fx["Date"]))
+
+    out = bands.set_index("Date").reindex(dates)
+    out[["lower", "upper"]] = np.exp(
+        np.log(out[["lower", "upper"]]).interpolate(method="time", limit_area="inside")
     )
 
-    lower0 = bands_2025.loc[bands_2025["Date"] == "2025-12-31", "lower"].iloc[0]
-    upper0 = bands_2025.loc[bands_2025["Date"] == "2025-12-31", "upper"].iloc[0]
-
-    cal = pd.DataFrame(
-        {"Date": pd.date_range("2026-01-01", b["Period"].max().to_timestamp("M"), freq="D")}
+    return (
+        out.join(fx.set_index("Date"), how="left", validate="one_to_one")
+        .rename_axis("Date")
+        .reset_index()
     )
-    cal["Period"] = cal["Date"].dt.to_period("M")
-    cal = cal.merge(b[["Period", "v_m_dec"]], on="Period", how="left")
-
-    r_d = (1 + cal["v_m_dec"]) ** (1 / 30) - 1
-    cal["lower"] = lower0 * (1 - r_d).cumprod()
-    cal["upper"] = upper0 * (1 + r_d).cumprod()
-
-    return cal[["Date", "lower", "upper"]]
 
 
 # ============================================================
 # Tasas – BCRA Monetarias
 # ============================================================
 @st.cache_data(ttl=60 * 60)
+@disk_cache("monetaria", ttl=60 * 60)
 def get_monetaria_serie(id_variable: int) -> pd.DataFrame:
     url = f"https://api.bcra.gob.ar/estadisticas/v4.0/Monetarias/{id_variable}"
-    r = requests.get(url, timeout=10, verify=False)
-    data = r.json()["results"][0]["detalle"]
+    # Mismo paginador que A3500, pero solo la primera página (los 1000 registros
+    # que el gráfico mostró siempre): el generador no llega a lanzar el resto.
+    detalle = next(iter_monetaria_pages(url), [])
 
-    df = pd.DataFrame(data)
-    df["Date"] = pd.to_datetime(df["fecha"], errors="coerce")
-    df["value"] = pd.to_numeric(df["valor"], errors="coerce")
+    df = pd.DataFrame(
+        {
+            "Date": pd.to_datetime(
+                [d["fecha"] for d in detalle], format="%Y-%m-%d", errors="coerce", cache=True
+            ),
+            "value": pd.to_numeric(
+                [d["valor"] for d in detalle], errors="coerce", downcast="float"
+            ),
+        }
+    )
 
     return (
-        df[["Date", "value"]]
-        .dropna()
+        df.dropna()
         .drop_duplicates(subset=["Date"])
         .sort_values("Date")
         .reset_index(drop=True)
@@ -236,74 +565,7 @@ def get_monetaria_serie(id_variable: int) -> pd.DataFrame:
 # ============================================================
 if st.session_state.section == "home":
 
-    st.markdown(
-        """
-        <style>
-          /* Oculta SOLO el título/caption global en Home (sin matar textos internos) */
-          div[data-testid="stAppViewContainer"] h1 { display:none; }
-          div[data-testid="stAppViewContainer"] .stCaption { display:none; }
-
-          /* Fondo gris claro */
-          [data-testid="stAppViewContainer"] { background: #f2f4f7; }
-
-          /* Contenedor centrado */
-          .home-wrap{
-            max-width: 980px;
-            margin: 0 auto;
-            padding-top: 10px;
-            text-align: center;
-          }
-
-          .home-title{
-            font-size: 44px;
-            font-weight: 800;
-            color: #0b2b4c;
-            margin-bottom: 10px;
-          }
-
-          .home-subtitle{
-            font-size: 18px;
-            color: #243447;
-            margin-bottom: 28px;
-          }
-
-          /* Cards SOLO para botones dentro de .home-cards */
-          .home-cards div.stButton > button{
-            width: 100% !important;
-            background: #dbeafe !important;
-            border: 1px solid rgba(11,43,76,0.18) !important;
-            border-radius: 18px !important;
-            padding: 18px 18px !important;
-            height: 90px !important;
-            box-shadow: 0 8px 22px rgba(0,0,0,0.06) !important;
-            transition: all 0.15s ease-in-out !important;
-          }
-
-          .home-cards div.stButton > button:hover{
-            transform: translateY(-2px);
-            box-shadow: 0 12px 28px rgba(0,0,0,0.10) !important;
-            border-color: rgba(11,43,76,0.30) !important;
-          }
-
-          /* Texto (emoji + nombre) */
-          .home-cards div.stButton > button{
-            color: #0b2b4c !important;
-            font-weight: 800 !important;
-            font-size: 20px !important;
-          }
-
-          @media (max-width: 900px){
-            .home-title{ font-size: 36px; }
-          }
-        </style>
-
-        <div class="home-wrap">
-          <div class="home-title">Macroeconomía</div>
-          <div class="home-subtitle">Seleccioná una variable</div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(HOME_HTML, unsafe_allow_html=True)
 
     # Centrado de las cards
     left_pad, mid, right_pad = st.columns([1, 6, 1])
@@ -350,32 +612,43 @@ if st.session_state.section == "fx":
         st.rerun()
 
     with st.spinner("Cargando datos..."):
-        fx = get_a3500()
-        rem = get_rem_last()
-        ipc = get_ipc_nacional_nivel_general()
+        fx, rem, ipc = fetch_concurrently(
+            get_a3500, get_rem_last, get_ipc_nacional_nivel_general
+        )
 
         bands_2025 = build_bands_2025("2025-04-14", "2025-12-31", 1000.0, 1400.0)
         bands_2026 = build_bands_2026(bands_2025, rem, ipc)
-        bands = pd.concat([bands_2025, bands_2026]).sort_values("Date")
+        # Ambos tramos ya vienen ordenados y son consecutivos en el tiempo.
+        bands = pd.concat([bands_2025, bands_2026], ignore_index=True)
 
-        df = bands.merge(fx, on="Date", how="left")
+        # Si la API del A3500 no respondió, se muestran solo las bandas: sin
+        # combinar con FX ni armar la traza/métrica de cotización.
+        has_fx = not fx.empty
+        df = combine_bands_fx(bands, fx) if has_fx else bands
 
     st.subheader("Tipo de cambio")
 
     c_left, c_right = st.columns([1, 3])
 
     with c_left:
-        last_fx = df["FX"].dropna().iloc[-1]
-        st.markdown(
-            f"<div style='font-size:46px; font-weight:700'>{last_fx:,.0f}</div>",
-            unsafe_allow_html=True,
-        )
+        if has_fx:
+            last_row = df.loc[df["FX"].last_valid_index()]
+            st.markdown(
+                f"<div style='font-size:46px; font-weight:700'>{last_row['FX']:,.0f}</div>",
+                unsafe_allow_html=True,
+            )
 
     with c_right:
+        import plotly.graph_objects as go
+
         fig = go.Figure()
-        fig.add_trace(go.Scatter(x=df["Date"], y=df["upper"], name="Banda superior", line=dict(dash="dash")))
-        fig.add_trace(go.Scatter(x=df["Date"], y=df["lower"], name="Banda inferior", line=dict(dash="dash"), fill="tonexty"))
-        fig.add_trace(go.Scatter(x=df["Date"], y=df["FX"], name="A3500"))
+        fig.add_trace(go.Scattergl(x=df["Date"], y=df["upper"], name="Banda superior", line=dict(dash="dash")))
+        fig.add_trace(go.Scattergl(x=df["Date"], y=df["lower"], name="Banda inferior", line=dict(dash="dash"), fill="tonexty"))
+        # Las bandas ya vienen en nodos mensuales + fechas con cotización; el
+        # FX se envía solo en las fechas cotizadas (sin los NaN de los nodos).
+        if has_fx:
+            fx_obs = df.loc[df["FX"].notna(), ["Date", "FX"]]
+            fig.add_trace(go.Scattergl(x=fx_obs["Date"], y=fx_obs["FX"], name="A3500"))
         fig.update_layout(hovermode="x unified", height=600)
         fig.update_yaxes(title_text="ARS / USD")
         fig.update_xaxes(title_text="")
@@ -404,8 +677,10 @@ if st.session_state.section == "tasa":
         )
 
     with c2:
+        import plotly.graph_objects as go
+
         fig = go.Figure()
-        fig.add_trace(go.Scatter(x=tasa["Date"], y=tasa["value"], name="Tasa"))
+        fig.add_trace(go.Scattergl(x=tasa["Date"], y=tasa["value"], name="Tasa"))
         fig.update_layout(hovermode="x unified", height=450)
         fig.update_yaxes(title_text="% TNA", ticksuffix="%")
         fig.update_xaxes(title_text="")
@@ -422,14 +697,11 @@ if st.session_state.section == "precios":
         st.session_state.section = "home"
         st.rerun()
 
-    ipc = get_ipc_indec_full()
-    ipc = ipc[ipc["Region"] == "Nacional"]
+    ipc, posiciones, opciones, default = get_ipc_index("Nacional")
 
-    opciones = sorted(ipc["Descripcion"].unique())
-    default = opciones.index("Nivel general") if "Nivel general" in opciones else 0
     desc = st.selectbox("Seleccioná una división", opciones, index=default)
 
-    serie = ipc[ipc["Descripcion"] == desc].dropna(subset=["v_m_IPC"])
+    serie = ipc.take(posiciones[desc]).dropna(subset=["v_m_IPC"])
 
     c1, c2 = st.columns([1, 3])
 
@@ -441,8 +713,10 @@ if st.session_state.section == "precios":
         )
 
     with c2:
+        import plotly.graph_objects as go
+
         fig = go.Figure()
-        fig.add_trace(go.Scatter(x=serie["Periodo"], y=serie["v_m_IPC"], name="Variación mensual"))
+        fig.add_trace(go.Scattergl(x=serie["Periodo"], y=serie["v_m_IPC"], name="Variación mensual"))
         fig.update_layout(hovermode="x unified", height=450)
         fig.update_yaxes(title_text="Variación mensual (%)", ticksuffix="%")
         fig.update_xaxes(title_text="")